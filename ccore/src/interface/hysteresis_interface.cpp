@@ -0,0 +1,99 @@
+/**
+*
+* Copyright (C) 2014-2017    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "interface/hysteresis_interface.h"
+
+
+void * hysteresis_create(const unsigned int p_size, const void * const p_weight) {
+    const pyclustering_package * const package_weight = (const pyclustering_package * const) p_weight;
+    std::vector<double> weight((double *) package_weight->data, ((double *) package_weight->data) + package_weight->size);
+
+    hysteresis_network * network = new hysteresis_network(p_size, weight);
+    return (void *) network;
+}
+
+
+void hysteresis_destroy(const void * p_pointer) {
+    delete (hysteresis_network *) p_pointer;
+}
+
+
+void hysteresis_set_states(const void * p_pointer, const void * const p_states) {
+    const pyclustering_package * const package_states = (const pyclustering_package * const) p_states;
+    std::vector<double> states((double *) package_states->data, ((double *) package_states->data) + package_states->size);
+
+    ((hysteresis_network *) p_pointer)->set_states(states);
+}
+
+
+void hysteresis_set_outputs(const void * p_pointer, const void * const p_outputs) {
+    const pyclustering_package * const package_outputs = (const pyclustering_package * const) p_outputs;
+    std::vector<double> outputs((double *) package_outputs->data, ((double *) package_outputs->data) + package_outputs->size);
+
+    ((hysteresis_network *) p_pointer)->set_outputs(outputs);
+}
+
+
+void * hysteresis_simulate_static(const void * p_pointer, const unsigned int p_steps, const double p_time, const bool p_collect_dynamic) {
+    hysteresis_dynamic * dynamic = new hysteresis_dynamic();
+    ((hysteresis_network *) p_pointer)->simulate_static(p_steps, p_time, p_collect_dynamic, (*dynamic));
+
+    return dynamic;
+}
+
+
+void hysteresis_dynamic_destroy(const void * p_pointer) {
+    delete (hysteresis_dynamic *) p_pointer;
+}
+
+
+pyclustering_package * hysteresis_dynamic_get_output(const void * p_pointer) {
+    hysteresis_dynamic & dynamic = *((hysteresis_dynamic *) p_pointer);
+
+    pyclustering_package * package = new pyclustering_package((unsigned int) pyclustering_type_data::PYCLUSTERING_TYPE_LIST);
+    package->size = dynamic.size();
+    package->data = new pyclustering_package * [package->size];
+
+    for (unsigned int i = 0; i < package->size; i++) {
+        ((pyclustering_package **) package->data)[i] = create_package(&dynamic[i].m_states);
+    }
+
+    return package;
+}
+
+
+pyclustering_package * hysteresis_dynamic_get_time(const void * p_pointer) {
+    hysteresis_dynamic & dynamic = *((hysteresis_dynamic *) p_pointer);
+
+    pyclustering_package * package = new pyclustering_package((unsigned int) pyclustering_type_data::PYCLUSTERING_TYPE_DOUBLE);
+    package->size = dynamic.size();
+    package->data = new double[package->size];
+
+    for (unsigned int i = 0; i < package->size; i++) {
+        ((double *) package->data)[i] = dynamic[i].m_time;
+    }
+
+    return package;
+}
+
+
+size_t hysteresis_dynamic_get_size(const void * p_pointer) {
+    return ((hysteresis_dynamic *) p_pointer)->size();
+}
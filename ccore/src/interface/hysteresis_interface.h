@@ -0,0 +1,138 @@
+/**
+*
+* Copyright (C) 2014-2017    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#ifndef SRC_INTERFACE_HYSTERESIS_INTERFACE_H_
+#define SRC_INTERFACE_HYSTERESIS_INTERFACE_H_
+
+
+#include "nnet/hysteresis.hpp"
+
+#include "interface/pyclustering_package.hpp"
+
+#include "definitions.hpp"
+#include "utils.hpp"
+
+
+/**
+*
+* @brief    Creates hysteresis oscillatory network.
+* @details  Caller should destroy created instance by 'hysteresis_destroy' when it is not required.
+*
+* @param[in] p_size: network size that is defined by amount of oscillators (neurons).
+* @param[in] p_weight: effective matrix of connection weights between neurons that is stored
+*             by rows in one plain sequence of size * size elements.
+*
+* @return   Pointer to instance of created oscillatory network.
+*
+* @see  hysteresis_destroy
+*
+*/
+extern "C" DECLARATION void * hysteresis_create(const unsigned int p_size, const void * const p_weight);
+
+/**
+*
+* @brief    Destroy instance of hysteresis oscillatory network.
+*
+* @param[in] p_pointer: pointer to instance of destroying network.
+*
+*/
+extern "C" DECLARATION void hysteresis_destroy(const void * p_pointer);
+
+/**
+*
+* @brief    Sets states of neurons of the hysteresis oscillatory network.
+*
+* @param[in] p_pointer: pointer to instance of the network.
+* @param[in] p_states: states of neurons.
+*
+*/
+extern "C" DECLARATION void hysteresis_set_states(const void * p_pointer, const void * const p_states);
+
+/**
+*
+* @brief    Sets outputs of neurons of the hysteresis oscillatory network.
+*
+* @param[in] p_pointer: pointer to instance of the network.
+* @param[in] p_outputs: outputs of neurons.
+*
+*/
+extern "C" DECLARATION void hysteresis_set_outputs(const void * p_pointer, const void * const p_outputs);
+
+/**
+*
+* @brief    Performs static simulation of the hysteresis oscillatory network.
+* @details  Caller should destroy output dynamic of the network when it is not required.
+*
+* @param[in] p_pointer: pointer to instance of the network that is simulated.
+* @param[in] p_steps: number steps of simulations during simulation.
+* @param[in] p_time: time of simulation.
+* @param[in] p_collect_dynamic: if true - returns whole dynamic of the network, otherwise only
+*             the last state of simulation.
+*
+* @return   Pointer to instance of output dynamic of the network.
+*
+* @see  hysteresis_dynamic_destroy
+*
+*/
+extern "C" DECLARATION void * hysteresis_simulate_static(const void * p_pointer, const unsigned int p_steps, const double p_time, const bool p_collect_dynamic);
+
+/**
+*
+* @brief    Destroy instance of output dynamic of the hysteresis oscillatory network.
+*
+* @param[in] p_pointer: pointer to instance of destroying output dynamic.
+*
+*/
+extern "C" DECLARATION void hysteresis_dynamic_destroy(const void * p_pointer);
+
+/**
+*
+* @brief    Returns states of each neuron on each iteration of simulation.
+*
+* @param[in] p_pointer: pointer to instance of output dynamic of the network.
+*
+* @return   Package with states of the network on each iteration of simulation.
+*
+*/
+extern "C" DECLARATION pyclustering_package * hysteresis_dynamic_get_output(const void * p_pointer);
+
+/**
+*
+* @brief    Returns time points of simulation of the hysteresis oscillatory network.
+*
+* @param[in] p_pointer: pointer to instance of output dynamic of the network.
+*
+* @return   Package with time points of simulation.
+*
+*/
+extern "C" DECLARATION pyclustering_package * hysteresis_dynamic_get_time(const void * p_pointer);
+
+/**
+*
+* @brief    Returns number of iterations of simulation that are stored in output dynamic.
+*
+* @param[in] p_pointer: pointer to instance of output dynamic of the network.
+*
+* @return   Number of iterations of simulation.
+*
+*/
+extern "C" DECLARATION size_t hysteresis_dynamic_get_size(const void * p_pointer);
+
+#endif
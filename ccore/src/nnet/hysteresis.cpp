@@ -0,0 +1,133 @@
+/**
+*
+* Copyright (C) 2014-2017    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "nnet/hysteresis.hpp"
+
+#include <cmath>
+#include <stdexcept>
+
+
+hysteresis_dynamic::hysteresis_dynamic(void) { }
+
+
+hysteresis_dynamic::~hysteresis_dynamic(void) { }
+
+
+hysteresis_network::hysteresis_network(const size_t size, const std::vector<double> & weight) :
+	m_size(size),
+	m_states(size, 0.0),
+	m_outputs(size, -1.0),
+	m_outputs_buffer(size, -1.0),
+	m_weight(weight)
+{
+	if (m_weight.size() != m_size * m_size) {
+		throw std::invalid_argument("Weight matrix of the hysteresis network should consist of size * size elements");
+	}
+}
+
+
+hysteresis_network::~hysteresis_network(void) { }
+
+
+void hysteresis_network::set_states(const std::vector<double> & states) {
+	m_states = states;
+}
+
+
+void hysteresis_network::set_outputs(const std::vector<double> & outputs) {
+	m_outputs = outputs;
+	m_outputs_buffer = outputs;
+}
+
+
+void hysteresis_network::simulate_static(const unsigned int steps, const double time, const bool collect_dynamic, hysteresis_dynamic & output_dynamic) {
+	const double step = time / (double) steps;
+	const double int_step = step / 10.0;
+
+	/* canonical integration grid of one step - matches numpy.arange(0, step, int_step) of the python implementation */
+	const unsigned int substeps = (unsigned int) std::ceil(step / int_step) - 1;
+
+	std::vector<double> impact(m_size, 0.0);
+
+	if (collect_dynamic) {
+		store_dynamic(0.0, output_dynamic);
+	}
+
+	for (unsigned int index_step = 1; index_step <= steps; index_step++) {
+		/* outputs of neurons are fixed during the step, thus the impact is calculated once per step */
+		calculate_impact(impact);
+		integrate_step(impact, substeps, int_step);
+
+		if (collect_dynamic || (index_step == steps)) {
+			store_dynamic(step * (double) index_step, output_dynamic);
+		}
+	}
+}
+
+
+void hysteresis_network::calculate_impact(std::vector<double> & impact) const {
+	for (size_t index = 0; index < m_size; index++) {
+		const double * weight_row = m_weight.data() + index * m_size;
+
+		double accumulator = 0.0;
+		for (size_t neighbor = 0; neighbor < m_size; neighbor++) {
+			accumulator += weight_row[neighbor] * m_outputs[neighbor];
+		}
+
+		impact[index] = accumulator;
+	}
+}
+
+
+void hysteresis_network::integrate_step(const std::vector<double> & impact, const unsigned int substeps, const double int_step) {
+	for (unsigned int substep = 0; substep < substeps; substep++) {
+		for (size_t index = 0; index < m_size; index++) {
+			double x = m_states[index];
+			const double coupling = impact[index];
+
+			const double k1 = int_step * (-x + coupling);
+			const double k2 = int_step * (-(x + k1 / 2.0) + coupling);
+			const double k3 = int_step * (-(x + k2 / 2.0) + coupling);
+			const double k4 = int_step * (-(x + k3) + coupling);
+
+			x = x + (k1 + 2.0 * k2 + 2.0 * k3 + k4) / 6.0;
+			m_states[index] = x;
+
+			if (x > 1.0) {
+				m_outputs_buffer[index] = 1.0;
+			}
+			else if (x < -1.0) {
+				m_outputs_buffer[index] = -1.0;
+			}
+		}
+	}
+
+	m_outputs = m_outputs_buffer;
+}
+
+
+void hysteresis_network::store_dynamic(const double time, hysteresis_dynamic & dynamic) const {
+	hysteresis_network_state state;
+
+	state.m_states = m_states;
+	state.m_time = time;
+
+	dynamic.push_back(state);
+}
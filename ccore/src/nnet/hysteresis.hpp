@@ -0,0 +1,125 @@
+/**
+*
+* Copyright (C) 2014-2017    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#ifndef _HYSTERESIS_H_
+#define _HYSTERESIS_H_
+
+#include <cstddef>
+#include <stdexcept>
+#include <vector>
+
+#include "container/dynamic_data.hpp"
+
+
+using namespace container;
+
+
+typedef std::vector<double>     hysteresis_matrix_row;
+typedef std::vector<double>     hysteresis_column;
+
+
+typedef struct hysteresis_network_state {
+public:
+	std::vector<double> m_states;
+
+	double				m_time;
+
+public:
+	inline size_t size(void) const { return m_states.size(); }
+
+	inline hysteresis_network_state & operator=(const hysteresis_network_state & other) {
+		if (this != &other) {
+			m_states.resize(other.size());
+			std::copy(other.m_states.cbegin(), other.m_states.cend(), m_states.begin());
+
+			m_time = other.m_time;
+		}
+
+		return *this;
+	}
+
+} hysteresis_network_state;
+
+
+class hysteresis_dynamic : public dynamic_data<hysteresis_network_state> {
+public:
+	hysteresis_dynamic(void);
+
+	~hysteresis_dynamic(void);
+};
+
+
+/***********************************************************************************************
+*
+* @brief   Hysteresis oscillatory network where each oscillator is an objective hysteresis
+*          neuron whose output belongs to range [-1, +1].
+*
+* @details States of neurons are described by dx/dt = -x + W * o where outputs 'o' are fixed
+*          during each step of simulation and are committed by hysteresis thresholding at the
+*          end of the step. The whole time-stepping is performed by native code - the weight
+*          matrix is stored by rows in one contiguous buffer and the integration by RK4 is
+*          fused with the thresholding in a single pass over the neurons per substep.
+*
+***********************************************************************************************/
+class hysteresis_network {
+private:
+	size_t						m_size;
+
+	std::vector<double>			m_states;
+	std::vector<double>			m_outputs;
+	std::vector<double>			m_outputs_buffer;
+
+	/* matrix of connection weights, stored by rows in one contiguous buffer */
+	std::vector<double>			m_weight;
+
+public:
+	hysteresis_network(const size_t size, const std::vector<double> & weight);
+
+	~hysteresis_network(void);
+
+public:
+	void set_states(const std::vector<double> & states);
+
+	void set_outputs(const std::vector<double> & outputs);
+
+	inline size_t size(void) const { return m_size; }
+
+	/***********************************************************************************************
+	*
+	* @brief   Performs static simulation of the network.
+	*
+	* @param[in]  steps: number of steps of simulation.
+	* @param[in]  time: time of simulation.
+	* @param[in]  collect_dynamic: if true - returns whole dynamic of the network, otherwise only
+	*             the last state of simulation.
+	* @param[out] output_dynamic: output dynamic of the network.
+	*
+	***********************************************************************************************/
+	void simulate_static(const unsigned int steps, const double time, const bool collect_dynamic, hysteresis_dynamic & output_dynamic);
+
+private:
+	void calculate_impact(std::vector<double> & impact) const;
+
+	void integrate_step(const std::vector<double> & impact, const unsigned int substeps, const double int_step);
+
+	void store_dynamic(const double time, hysteresis_dynamic & dynamic) const;
+};
+
+#endif
@@ -0,0 +1,108 @@
+"""!
+
+@brief CCORE Wrapper for Hysteresis Oscillatory Network
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2017
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+from pyclustering.core.wrapper import *;
+
+
+def _create_double_package(values):
+    c_values = (c_double * len(values))();
+    c_values[:] = values[:];
+
+    package = pyclustering_package();
+    package.size = len(values);
+    package.type = pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE;
+    package.data = cast(c_values, POINTER(c_void_p));
+
+    return package;
+
+
+def hysteresis_create(size, weight):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_create.restype = c_void_p;
+
+    package = _create_double_package(weight);
+
+    hysteresis_pointer = ccore.hysteresis_create(c_uint(size), pointer(package));
+    return hysteresis_pointer;
+
+
+def hysteresis_destroy(network_pointer):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_destroy(c_void_p(network_pointer));
+
+
+def hysteresis_set_states(network_pointer, states):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+
+    package = _create_double_package(states);
+    ccore.hysteresis_set_states(c_void_p(network_pointer), pointer(package));
+
+
+def hysteresis_set_outputs(network_pointer, outputs):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+
+    package = _create_double_package(outputs);
+    ccore.hysteresis_set_outputs(c_void_p(network_pointer), pointer(package));
+
+
+def hysteresis_simulate_static(network_pointer, steps, time, collect_dynamic):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_simulate_static.restype = c_void_p;
+
+    return ccore.hysteresis_simulate_static(c_void_p(network_pointer), c_uint(steps), c_double(time), c_bool(collect_dynamic));
+
+
+def hysteresis_dynamic_destroy(dynamic_pointer):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_dynamic_destroy(c_void_p(dynamic_pointer));
+
+
+def hysteresis_dynamic_get_output(dynamic_pointer):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_dynamic_get_output.restype = c_void_p;
+
+    package = ccore.hysteresis_dynamic_get_output(c_void_p(dynamic_pointer));
+
+    result = extract_pyclustering_package(package);
+    ccore.free_pyclustering_package(c_void_p(package));
+
+    return result;
+
+
+def hysteresis_dynamic_get_time(dynamic_pointer):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    ccore.hysteresis_dynamic_get_time.restype = c_void_p;
+
+    package = ccore.hysteresis_dynamic_get_time(c_void_p(dynamic_pointer));
+
+    result = extract_pyclustering_package(package);
+    ccore.free_pyclustering_package(c_void_p(package));
+
+    return result;
+
+
+def hysteresis_dynamic_get_size(dynamic_pointer):
+    ccore = cdll.LoadLibrary(PATH_DLL_CCORE_64);
+    return ccore.hysteresis_dynamic_get_size(c_void_p(dynamic_pointer));
@@ -25,6 +25,8 @@
 
 """
 
+import numpy;
+
 from pyclustering.nnet.hysteresis import hysteresis_network, hysteresis_dynamic;
 
 
@@ -139,23 +141,19 @@ class hysteresisgcolor(hysteresis_network):
         
         super().__init__(number_oscillators);
         
-        self._states = [0] * self._num_osc;
-        for i in range(0, self._num_osc):
-            self._states[i] = 1 - (2 / self._num_osc) * i;
-        
-        self._outputs = [-1] * self._num_osc;
-        self._outputs_buffer = [-1] * self._num_osc;
+        self._states = (1.0 - (2.0 / self._num_osc) * numpy.arange(self._num_osc)).astype(self._dtype);
+
+        self._outputs = numpy.full(self._num_osc, -1.0, dtype = self._dtype);
+        self._outputs_buffer = numpy.full(self._num_osc, -1.0, dtype = self._dtype);
         self._time_contant = 1;
-        
+
         # Create connections
-        self._weight = [];
-        for row in range(0, self._num_osc):
-            self._weight.append([0] * self._num_osc);
-            for col in range(0, self._num_osc):
-                if (row != col):
-                    self._weight[row][col] = -alpha * (graph_matrix[row][col]) / sum(graph_matrix[row]);
-                else:
-                    self._weight[row][col] = -alpha - eps;
+        graph = numpy.asarray(graph_matrix, dtype = numpy.float64);
+
+        weight = -alpha * graph / graph.sum(axis = 1)[:, numpy.newaxis];
+        numpy.fill_diagonal(weight, -alpha - eps);
+
+        self.weight = weight;
     
     
     def process(self, steps, time, collect_dynamic = True):
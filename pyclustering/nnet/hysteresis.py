@@ -28,12 +28,336 @@
 
 import numpy;
 
-from scipy.integrate import odeint;
+from scipy.integrate import solve_ivp;
+from scipy.sparse import csr_matrix;
 
 from pyclustering.nnet import *;
 
 from pyclustering.utils import draw_dynamics;
 
+import pyclustering.core.hysteresis_wrapper as wrapper;
+
+try:
+    from numba import njit, prange;
+    NUMBA_SUPPORT = True;
+except ImportError:
+    prange = range;
+    NUMBA_SUPPORT = False;
+
+
+# networks of this size and above are simulated by kernels that are parallelized across
+# oscillators - below it the cost of scattering work to threads exceeds the work itself.
+_PARALLEL_SIZE_THRESHOLD = 64;
+
+
+def _dense_impact(W_t, outputs, impact):
+    """!
+    @brief Calculates coupling impact on each neuron over the dense transposed weight matrix.
+    @details Impact is accumulated row by row: the output of a neuron is broadcast and
+              multiply-added across a contiguous row, thus the inner loop vectorizes to
+              SIMD FMAs with unit-stride reads.
+
+    @param[in] W_t (numpy.ndarray): Transposed effective matrix of connection weights between neurons.
+    @param[in] outputs (numpy.ndarray): Outputs of neurons.
+    @param[in,out] impact (numpy.ndarray): Storage where the impact on each neuron is accumulated.
+
+    """
+
+    number_oscillators = outputs.shape[0];
+
+    for i in range(number_oscillators):
+        impact[i] = 0.0;
+
+    for j in range(number_oscillators):
+        output_j = outputs[j];
+        for i in range(number_oscillators):
+            impact[i] += W_t[j][i] * output_j;
+
+
+def _csr_impact(indptr, indices, data, outputs, impact):
+    """!
+    @brief Calculates coupling impact on each neuron over the weight matrix in CSR format.
+    @details Only weights of existing connections are visited, thus the work is proportional
+              to the number of edges of the network instead of N^2.
+
+    @param[in] indptr (numpy.ndarray): Row pointers of the CSR weight matrix.
+    @param[in] indices (numpy.ndarray): Column indices of non-zero weights.
+    @param[in] data (numpy.ndarray): Non-zero weights of connections.
+    @param[in] outputs (numpy.ndarray): Outputs of neurons.
+    @param[in,out] impact (numpy.ndarray): Storage where the impact on each neuron is accumulated.
+
+    """
+
+    for i in range(outputs.shape[0]):
+        accumulator = 0.0;
+        for k in range(indptr[i], indptr[i + 1]):
+            accumulator += data[k] * outputs[indices[k]];
+
+        impact[i] = accumulator;
+
+
+def _rk4_hysteresis(states, outputs, outputs_buffer, impact, n_steps, dt):
+    """!
+    @brief Integrates states of the hysteresis oscillatory network by classical RK4 method.
+    @details Free function that is compiled by numba (when the package is available) - the whole
+              time-stepping of the network is performed without participation of the interpreter.
+              State update, hysteresis thresholding and the final commit of outputs are fused
+              into a single pass over the neurons per substep. Outputs of neurons are fixed
+              during the integration, therefore the impact is calculated once by the caller.
+
+    @param[in,out] states (numpy.ndarray): Current states of all neurons that are advanced by the integration.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed at the end of the integration.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] impact (numpy.ndarray): Coupling impact on each neuron that is fixed during the integration.
+    @param[in] n_steps (uint): Number of integration substeps.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) New states of all neurons.
+
+    """
+
+    for s in range(n_steps):
+        last_substep = (s == n_steps - 1);
+
+        for i in range(states.shape[0]):
+            x = states[i];
+            c = impact[i];
+
+            k1 = dt * (-x + c);
+            k2 = dt * (-(x + k1 / 2.0) + c);
+            k3 = dt * (-(x + k2 / 2.0) + c);
+            k4 = dt * (-(x + k3) + c);
+
+            x = x + (k1 + 2.0 * k2 + 2.0 * k3 + k4) / 6.0;
+            states[i] = x;
+
+            # branchless thresholding - near the switching region the branches are data-dependent
+            # and hard to predict, the arithmetic select compiles to compare and blend instead.
+            outputs_buffer[i] = 1.0 * (x > 1.0) - 1.0 * (x < -1.0) + outputs_buffer[i] * ((x >= -1.0) and (x <= 1.0));
+
+            if (last_substep is True):
+                outputs[i] = outputs_buffer[i];
+
+    return states;
+
+
+def _simulate_hysteresis(states, outputs, outputs_buffer, W_t, dyn_state, n_steps, n_substeps, dt):
+    """!
+    @brief Performs simulation of the hysteresis oscillatory network for all steps in one call.
+    @details Advances states of neurons by RK4 for each step of simulation, commits outputs of
+              neurons and stores states to the dynamic - the whole simulation is performed by
+              one call of compiled code when numba is available.
+
+    @param[in] states (numpy.ndarray): Initial states of all neurons in the network.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed after each step of simulation.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] W_t (numpy.ndarray): Transposed effective matrix of connection weights between neurons.
+    @param[in,out] dyn_state (numpy.ndarray): Storage of the output dynamic where states are placed after each step.
+    @param[in] n_steps (uint): Number of steps of simulation.
+    @param[in] n_substeps (uint): Number of integration substeps of each step of simulation.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) States of all neurons at the end of simulation.
+
+    """
+
+    impact = numpy.zeros_like(states);
+
+    for index_step in range(n_steps):
+        _dense_impact(W_t, outputs, impact);
+        states = _rk4_hysteresis(states, outputs, outputs_buffer, impact, n_substeps, dt);
+        dyn_state[index_step + 1] = states;
+
+    return states;
+
+
+def _simulate_hysteresis_sparse(states, outputs, outputs_buffer, indptr, indices, data, dyn_state, n_steps, n_substeps, dt):
+    """!
+    @brief Performs simulation of the hysteresis oscillatory network with sparse connectivity.
+    @details Identical to _simulate_hysteresis except that the coupling impact is calculated
+              over the weight matrix in CSR format, thus non-existing connections cost nothing.
+
+    @param[in] states (numpy.ndarray): Initial states of all neurons in the network.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed after each step of simulation.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] indptr (numpy.ndarray): Row pointers of the CSR weight matrix.
+    @param[in] indices (numpy.ndarray): Column indices of non-zero weights.
+    @param[in] data (numpy.ndarray): Non-zero weights of connections.
+    @param[in,out] dyn_state (numpy.ndarray): Storage of the output dynamic where states are placed after each step.
+    @param[in] n_steps (uint): Number of steps of simulation.
+    @param[in] n_substeps (uint): Number of integration substeps of each step of simulation.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) States of all neurons at the end of simulation.
+
+    """
+
+    impact = numpy.zeros_like(states);
+
+    for index_step in range(n_steps):
+        _csr_impact(indptr, indices, data, outputs, impact);
+        states = _rk4_hysteresis(states, outputs, outputs_buffer, impact, n_substeps, dt);
+        dyn_state[index_step + 1] = states;
+
+    return states;
+
+def _dense_impact_parallel(W, outputs, impact):
+    """!
+    @brief Calculates coupling impact on each neuron over the dense weight matrix in parallel.
+    @details Rows of the matrix are scattered to threads - each thread accumulates impact on its
+              own slice of neurons, thus there is no write contention between threads.
+
+    @param[in] W (numpy.ndarray): Effective matrix of connection weights between neurons.
+    @param[in] outputs (numpy.ndarray): Outputs of neurons.
+    @param[in,out] impact (numpy.ndarray): Storage where the impact on each neuron is accumulated.
+
+    """
+
+    for i in prange(W.shape[0]):
+        accumulator = 0.0;
+        for j in range(W.shape[1]):
+            accumulator += W[i][j] * outputs[j];
+
+        impact[i] = accumulator;
+
+
+def _csr_impact_parallel(indptr, indices, data, outputs, impact):
+    """!
+    @brief Calculates coupling impact on each neuron over the CSR weight matrix in parallel.
+    @details Rows of the matrix are scattered to threads like in _dense_impact_parallel, only
+              weights of existing connections are visited.
+
+    @param[in] indptr (numpy.ndarray): Row pointers of the CSR weight matrix.
+    @param[in] indices (numpy.ndarray): Column indices of non-zero weights.
+    @param[in] data (numpy.ndarray): Non-zero weights of connections.
+    @param[in] outputs (numpy.ndarray): Outputs of neurons.
+    @param[in,out] impact (numpy.ndarray): Storage where the impact on each neuron is accumulated.
+
+    """
+
+    for i in prange(outputs.shape[0]):
+        accumulator = 0.0;
+        for k in range(indptr[i], indptr[i + 1]):
+            accumulator += data[k] * outputs[indices[k]];
+
+        impact[i] = accumulator;
+
+
+def _rk4_hysteresis_parallel(states, outputs, outputs_buffer, impact, n_steps, dt):
+    """!
+    @brief Integrates states of the hysteresis oscillatory network by RK4 in parallel.
+    @details The impact on each neuron is fixed during the integration, thus neurons are
+              completely independent within a step of simulation - each thread advances its own
+              slice of neurons through all substeps with state, impact and output held in
+              registers, which also spares the substep-by-substep passes over all arrays of the
+              serial kernel.
+
+    @param[in,out] states (numpy.ndarray): Current states of all neurons that are advanced by the integration.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed at the end of the integration.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] impact (numpy.ndarray): Coupling impact on each neuron that is fixed during the integration.
+    @param[in] n_steps (uint): Number of integration substeps.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) New states of all neurons.
+
+    """
+
+    for i in prange(states.shape[0]):
+        x = states[i];
+        c = impact[i];
+        o = outputs_buffer[i];
+
+        for s in range(n_steps):
+            k1 = dt * (-x + c);
+            k2 = dt * (-(x + k1 / 2.0) + c);
+            k3 = dt * (-(x + k2 / 2.0) + c);
+            k4 = dt * (-(x + k3) + c);
+
+            x = x + (k1 + 2.0 * k2 + 2.0 * k3 + k4) / 6.0;
+
+            o = 1.0 * (x > 1.0) - 1.0 * (x < -1.0) + o * ((x >= -1.0) and (x <= 1.0));
+
+        states[i] = x;
+        outputs_buffer[i] = o;
+        outputs[i] = o;
+
+    return states;
+
+
+def _simulate_hysteresis_parallel(states, outputs, outputs_buffer, W, dyn_state, n_steps, n_substeps, dt):
+    """!
+    @brief Performs simulation of the hysteresis oscillatory network with work parallelized
+            across oscillators.
+    @details Identical to _simulate_hysteresis except that the coupling impact and the
+              integration are performed by kernels that scatter rows to threads.
+
+    @param[in] states (numpy.ndarray): Initial states of all neurons in the network.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed after each step of simulation.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] W (numpy.ndarray): Effective matrix of connection weights between neurons.
+    @param[in,out] dyn_state (numpy.ndarray): Storage of the output dynamic where states are placed after each step.
+    @param[in] n_steps (uint): Number of steps of simulation.
+    @param[in] n_substeps (uint): Number of integration substeps of each step of simulation.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) States of all neurons at the end of simulation.
+
+    """
+
+    impact = numpy.zeros_like(states);
+
+    for index_step in range(n_steps):
+        _dense_impact_parallel(W, outputs, impact);
+        states = _rk4_hysteresis_parallel(states, outputs, outputs_buffer, impact, n_substeps, dt);
+        dyn_state[index_step + 1] = states;
+
+    return states;
+
+
+def _simulate_hysteresis_sparse_parallel(states, outputs, outputs_buffer, indptr, indices, data, dyn_state, n_steps, n_substeps, dt):
+    """!
+    @brief Performs simulation of the hysteresis oscillatory network with sparse connectivity
+            and work parallelized across oscillators.
+
+    @param[in] states (numpy.ndarray): Initial states of all neurons in the network.
+    @param[in,out] outputs (numpy.ndarray): Outputs of neurons that are committed after each step of simulation.
+    @param[in,out] outputs_buffer (numpy.ndarray): Buffer of outputs that is updated by hysteresis thresholding.
+    @param[in] indptr (numpy.ndarray): Row pointers of the CSR weight matrix.
+    @param[in] indices (numpy.ndarray): Column indices of non-zero weights.
+    @param[in] data (numpy.ndarray): Non-zero weights of connections.
+    @param[in,out] dyn_state (numpy.ndarray): Storage of the output dynamic where states are placed after each step.
+    @param[in] n_steps (uint): Number of steps of simulation.
+    @param[in] n_substeps (uint): Number of integration substeps of each step of simulation.
+    @param[in] dt (double): Step of integration.
+
+    @return (numpy.ndarray) States of all neurons at the end of simulation.
+
+    """
+
+    impact = numpy.zeros_like(states);
+
+    for index_step in range(n_steps):
+        _csr_impact_parallel(indptr, indices, data, outputs, impact);
+        states = _rk4_hysteresis_parallel(states, outputs, outputs_buffer, impact, n_substeps, dt);
+        dyn_state[index_step + 1] = states;
+
+    return states;
+
+
+if (NUMBA_SUPPORT is True):
+    _dense_impact = njit(cache = True, fastmath = True)(_dense_impact);
+    _csr_impact = njit(cache = True, fastmath = True)(_csr_impact);
+    _rk4_hysteresis = njit(cache = True, fastmath = True)(_rk4_hysteresis);
+    _simulate_hysteresis = njit(cache = True, fastmath = True)(_simulate_hysteresis);
+    _simulate_hysteresis_sparse = njit(cache = True, fastmath = True)(_simulate_hysteresis_sparse);
+
+    _dense_impact_parallel = njit(parallel = True, cache = True, fastmath = True)(_dense_impact_parallel);
+    _csr_impact_parallel = njit(parallel = True, cache = True, fastmath = True)(_csr_impact_parallel);
+    _rk4_hysteresis_parallel = njit(parallel = True, cache = True, fastmath = True)(_rk4_hysteresis_parallel);
+    _simulate_hysteresis_parallel = njit(cache = True, fastmath = True)(_simulate_hysteresis_parallel);
+    _simulate_hysteresis_sparse_parallel = njit(cache = True, fastmath = True)(_simulate_hysteresis_sparse_parallel);
+
 
 class hysteresis_dynamic:
     """!
@@ -86,20 +410,43 @@ class hysteresis_dynamic:
         return len(self._dynamic);
     
     
-    def allocate_sync_ensembles(self, tolerance = 0.1, threshold_steps = 1):
+    def allocate_sync_ensembles(self, tolerance = 0.1, threshold_steps = 1, legacy_behavior = False):
         """!
         @brief Allocate clusters in line with ensembles of synchronous oscillators where each
                synchronous ensemble corresponds to only one cluster.
-               
+        @details Oscillators are sorted by their amplitudes at the last step of simulation and
+                  ensembles are split where difference between neighbors in the sorted order
+                  exceeds tolerance at any of the analysed steps - an O(N log N) grouping with
+                  equivalence-class semantics. The original greedy first-match allocation is
+                  available via the 'legacy_behavior' flag.
+
         @param[in] tolerance (double): Maximum error for allocation of synchronous ensemble oscillators.
         @param[in] threshold_steps (uint): Number of steps from the end of simulation that should be analysed for ensemble allocation.
                     If amout of simulation steps has been less than threshold steps than amount of steps will be reduced to amout
                     of simulation steps.
-        
+        @param[in] legacy_behavior (bool): If True - allocation is performed by the original greedy algorithm where
+                    each oscillator is captured by the first close enough ensemble.
+
         @return (list) Grours of indexes of synchronous oscillators, for example, [ [index_osc1, index_osc3], [index_osc2], [index_osc4, index_osc5] ]."
-        
+
         """
-        
+
+        if (legacy_behavior is False):
+            dynamic = numpy.asarray(self._dynamic, dtype = numpy.float64);
+
+            analysis_steps = threshold_steps;
+            if (len(self._dynamic) < analysis_steps):
+                analysis_steps = len(self._dynamic);
+
+            window = dynamic[len(dynamic) - analysis_steps : ];
+
+            order = numpy.argsort(window[-1]);
+
+            gaps = ( numpy.abs(numpy.diff(window[:, order], axis = 1)) >= tolerance ).any(axis = 0);
+            group_id = numpy.concatenate(( [0], numpy.cumsum(gaps) ));
+
+            return [ order[group_id == group].tolist() for group in range(group_id[-1] + 1) ];
+
         clusters = [ [0] ];
         
         number_oscillators = len(self._dynamic[0]);
@@ -197,8 +544,15 @@ class hysteresis_network(network):
         
         """
         
-        self._outputs = [val for val in values];
-        self._outputs_buffer = [val for val in values];
+        values = numpy.asarray(values, dtype = self._dtype);
+
+        if (self._outputs.shape == values.shape):
+            # reuse preallocated buffers to avoid reallocation between simulations.
+            numpy.copyto(self._outputs, values);
+            numpy.copyto(self._outputs_buffer, values);
+        else:
+            self._outputs = values.copy();
+            self._outputs_buffer = values.copy();
     
     @property
     def states(self):
@@ -218,68 +572,211 @@ class hysteresis_network(network):
         
         """
         
-        self._states = [val for val in values];
-   
-    
-    def __init__(self, num_osc, own_weight = -4, neigh_weight = -1, type_conn = conn_type.ALL_TO_ALL, type_conn_represent = conn_represent.MATRIX):
+        self._states = numpy.array(values, dtype = self._dtype);
+
+    @property
+    def weight(self):
+        """!
+        @brief Returns matrix of connection weights between neurons.
+        @details The returned matrix is read-only - weights are redefined through the setter
+                  only, thus cached packed representations can never become stale silently.
+
+        @return (numpy.ndarray) Matrix of connection weights between neurons.
+
+        """
+
+        view = self._weight.view();
+        view.setflags(write = False);
+
+        return view;
+
+    @weight.setter
+    def weight(self, values):
+        """!
+        @brief Sets matrix of connection weights between neurons.
+        @details Packed representations of weights that are used by simulation (effective and CSR
+                  matrices, generated right hand sides) are rebuilt at the beginning of the next
+                  simulation - repeated simulations with unchanged weights reuse them as they are.
+
+        """
+
+        self._weight = numpy.array(values, dtype = self._dtype);
+        self._weight_dirty = True;
+
+
+
+    def __init__(self, num_osc, own_weight = -4, neigh_weight = -1, type_conn = conn_type.ALL_TO_ALL, type_conn_represent = conn_represent.MATRIX, ccore = False):
         """!
         @brief Constructor of hysteresis oscillatory network.
-        
+
         @param[in] num_osc (uint): Number of oscillators in the network.
         @param[in] own_weight (double): Weight of connection from oscillator to itself - own weight.
         @param[in] neigh_weight (double): Weight of connection between oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network.
         @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
-        
+        @param[in] ccore (bool): If True - simulation is performed by CCORE library (C++ implementation of pyclustering).
+
         """
-        
+
         super().__init__(num_osc, type_conn, type_conn_represent);
-        
-        # list of states of neurons.
-        self._states = [0] * self._num_osc;
-        
-        # list of current outputs of neurons.
-        self._outputs = [-1] * self._num_osc;
-        
-        # list of previous outputs of neurons
-        self._outputs_buffer = [-1] * self._num_osc;
-        
+
+        # the network is created on the CCORE side at the beginning of simulation when the weight
+        # matrix is final - weights can be redefined after construction (graph coloring does it).
+        self._ccore = ccore;
+
+        # data type of simulation arithmetic - the model is an approximate heuristic with outputs
+        # in [-1, 1], thus single precision is enough and halves memory traffic of the simulation.
+        self._dtype = numpy.float32;
+
+        # states of neurons.
+        self._states = numpy.zeros(self._num_osc, dtype = self._dtype);
+
+        # current outputs of neurons.
+        self._outputs = numpy.full(self._num_osc, -1.0, dtype = self._dtype);
+
+        # previous outputs of neurons.
+        self._outputs_buffer = numpy.full(self._num_osc, -1.0, dtype = self._dtype);
+
         # matrix of connection weights between neurons.
-        self._weight = list();
+        self._weight = numpy.full((self._num_osc, self._num_osc), neigh_weight, dtype = self._dtype);
+        numpy.fill_diagonal(self._weight, own_weight);
+
+        # packed representations of weights are rebuilt only when the flag is raised - the flag
+        # is set by the weight setter, thus repeated simulations reuse them at zero cost.
+        self._weight_dirty = True;
+
+        # connectivity mask of the network - materialized once, connections are never checked during simulation.
+        # the mask is built by traversal of neighbors, thus construction is O(N + E) instead of the
+        # O(N^2) pairwise has_connection scan that is linear in the vertex degree for the list representation.
+        self._conn_mask = numpy.zeros((self._num_osc, self._num_osc), dtype = bool);
         for index in range(0, self._num_osc, 1):
-            self._weight.append( [neigh_weight] * self._num_osc);
-            self._weight[index][index] = own_weight;
+            for neighbor in self.get_neighbors(index):
+                self._conn_mask[neighbor][index] = True;
 
-    
-    def _neuron_states(self, inputs, t, argv):
+        # effective weight matrix where disconnected pairs are zeroed - prepared before each simulation.
+        self._W = None;
+
+        # constant Jacobian of the right hand side that is supplied to the stiff solver -
+        # allocated only when the fallback solver is used, the compiled kernels never read it.
+        self._jac_matrix = None;
+
+        # specialized right hand side that is generated at runtime for small networks.
+        self._rhs_compiled = None;
+
+
+    def _prepare_weight_matrix(self):
         """!
-        @brief Returns new value of the neuron (oscillator).
-        
-        @param[in] inputs (list): Initial values (current) of the neuron - excitatory.
-        @param[in] t (double): Current time of simulation.
-        @param[in] argv (tuple): Extra arguments that are not used for integration - index of the neuron.
-        
-        @return (double) New value of the neuron.
-        
+        @brief Prepares effective weight matrix that is used for calculation of impact on each neuron.
+        @details Impact of disconnected oscillators is zeroed in the matrix by the connectivity mask,
+                  thus impact on the whole network is calculated by single matrix-vector multiplication
+                  without connection checks. Own weight of each neuron is placed on the diagonal.
+                  Prepared representations are cached across simulations and are rebuilt only when
+                  weights have been redefined through the weight setter.
+
         """
-        
-        xi = inputs[0];
-        index = argv;
-        
-        # own impact
-        impact = self._weight[index][index] * self._outputs[index];
-        
-        for i in range(0, self._num_osc, 1):
-            if (self.has_connection(i, index)):
-                impact += self._weight[index][i] * self._outputs[i];
 
-        x = -xi + impact;
-                
-        if (xi > 1): self._outputs_buffer[index] = 1; 
-        if (xi < -1): self._outputs_buffer[index] = -1;
-       
-        return x;
-        
+        if (self._weight_dirty is False):
+            return;
+
+        weight = numpy.asarray(self._weight, dtype = self._dtype);
+
+        self._W = weight * self._conn_mask;
+        numpy.fill_diagonal(self._W, numpy.diag(weight));
+
+        # sparsely connected networks are stored in CSR format in addition - the coupling impact
+        # is then proportional to the number of edges instead of N^2; representation of the
+        # connections (matrix or list) does not matter, only density of the structure does.
+        self._W_csr = None;
+        if (numpy.count_nonzero(self._W) < 0.25 * self._num_osc * self._num_osc):
+            self._W_csr = csr_matrix(self._W);
+
+        # right hand side for the fallback solver - the compiled kernel never calls it: small
+        # networks are dominated by interpreter overhead, thus a specialized unrolled version
+        # with weights baked in as literals is generated for them.
+        self._rhs_compiled = None;
+        if (NUMBA_SUPPORT is False):
+            if (self._num_osc <= 16):
+                self._rhs_compiled = self._generate_unrolled_rhs();
+            else:
+                self._rhs_compiled = self._generate_general_rhs();
+
+            if (self._jac_matrix is None):
+                self._jac_matrix = -numpy.eye(self._num_osc);
+
+        self._weight_dirty = False;
+
+
+    def _generate_general_rhs(self):
+        """!
+        @brief Generates general right hand side of the network with state bound by closure.
+        @details The weight matrix and outputs of neurons are captured as local variables, so the
+                  solver does not pay for attribute lookups on the instance on every evaluation.
+
+        @return (callable) Right hand side with signature (t, x).
+
+        """
+
+        W = self._W;
+        if (self._W_csr is not None):
+            W = self._W_csr;
+
+        o = self._outputs;
+
+        def _general_rhs(t, x):
+            return -x + W.dot(o);
+
+        return _general_rhs;
+
+
+    def _generate_unrolled_rhs(self):
+        """!
+        @brief Generates specialized right hand side of the network at runtime.
+        @details The N x N multiply-adds of the coupling impact are fully unrolled into
+                  straight-line code where weights are baked in as numeric literals and zero
+                  weights of disconnected pairs are skipped. Outputs of neurons are bound by
+                  closure, so the generated function reads them without attribute lookups.
+
+        @return (callable) Right hand side with signature (t, x) that is specialized for the
+                 current weights of the network.
+
+        """
+
+        expressions = [];
+        for index in range(0, self._num_osc, 1):
+            terms = [ "-x[%u]" % index ];
+            for i in range(0, self._num_osc, 1):
+                w = float(self._W[index][i]);
+                if (w != 0.0):
+                    terms.append("(%r) * o[%u]" % (w, i));
+
+            expressions.append(" + ".join(terms));
+
+        source = "def _make_rhs(o):\n";
+        source += "    def _unrolled_rhs(t, x):\n";
+        source += "        return [ " + ", ".join(expressions) + " ];\n";
+        source += "    return _unrolled_rhs;\n";
+
+        namespace = {};
+        exec(compile(source, "<hysteresis_rhs>", "exec"), namespace);
+
+        return namespace["_make_rhs"](self._outputs);
+
+
+    def _jac(self, t, states):
+        """!
+        @brief Returns Jacobian of the right hand side of the network.
+        @details Outputs of neurons are fixed during a step of simulation, thus the Jacobian of
+                  dx/dt = -x + W * o is the constant matrix -I that is prepared in the constructor.
+
+        @param[in] t (double): Current time of simulation, is not used - the Jacobian is constant.
+        @param[in] states (numpy.ndarray): Current states of all neurons, are not used - the Jacobian is constant.
+
+        @return (numpy.ndarray) Jacobian of the right hand side of the network.
+
+        """
+
+        return self._jac_matrix;
+
     
     def simulate(self, steps, time, solution = solve_type.RK4, collect_dynamic = True):
         """!
@@ -317,53 +814,143 @@ class hysteresis_network(network):
         elif (solution == solve_type.RKF45):
             raise NameError("Solver RKF45 is not support in python version.");
 
+        self._states = numpy.asarray(self._states, dtype = self._dtype);
+        self._outputs = numpy.asarray(self._outputs, dtype = self._dtype);
+        self._outputs_buffer = numpy.asarray(self._outputs_buffer, dtype = self._dtype);
+
+        self._prepare_weight_matrix();
+
+        if (self._ccore is True):
+            return self._simulate_static_ccore(steps, time, collect_dynamic);
+
+        step = time / steps;
+        int_step = step / 10.0;
+
+        t_points = numpy.arange(step, time + step, step);
+
+        # canonical integration grid of one step - the right hand side is time-invariant, thus the
+        # same relative grid is reused for every step instead of allocation of a new one per step.
+        t_sub = numpy.arange(0.0, step, int_step);
+        number_int_steps = len(t_sub) - 1;
+
+        if (NUMBA_SUPPORT is True):
+            # the whole simulation is performed by one call of the compiled kernel.
+            whole_dynamic = numpy.empty((len(t_points) + 1, self._num_osc), dtype = self._dtype);
+            whole_dynamic[0] = self._states;
+
+            # large networks are simulated by kernels where rows of the weight matrix are
+            # scattered to threads - each thread advances its own slice of neurons.
+            parallel_simulation = (self._num_osc >= _PARALLEL_SIZE_THRESHOLD);
+
+            if (self._W_csr is not None):
+                if (parallel_simulation is True):
+                    self._states = _simulate_hysteresis_sparse_parallel(self._states, self._outputs, self._outputs_buffer,
+                                                                        self._W_csr.indptr, self._W_csr.indices, self._W_csr.data,
+                                                                        whole_dynamic, len(t_points), number_int_steps, int_step);
+                else:
+                    self._states = _simulate_hysteresis_sparse(self._states, self._outputs, self._outputs_buffer,
+                                                               self._W_csr.indptr, self._W_csr.indices, self._W_csr.data,
+                                                               whole_dynamic, len(t_points), number_int_steps, int_step);
+            elif (parallel_simulation is True):
+                self._states = _simulate_hysteresis_parallel(self._states, self._outputs, self._outputs_buffer, self._W, whole_dynamic, len(t_points), number_int_steps, int_step);
+            else:
+                self._states = _simulate_hysteresis(self._states, self._outputs, self._outputs_buffer, numpy.ascontiguousarray(self._W.T), whole_dynamic, len(t_points), number_int_steps, int_step);
+
+            if (collect_dynamic is True):
+                dyn_state = whole_dynamic;
+                dyn_time = [0] + t_points.tolist();
+            else:
+                dyn_state = [ self._states.copy() ];
+                dyn_time = [ time ];
+
+            return hysteresis_dynamic(dyn_state, dyn_time);
+
         dyn_state = None;
         dyn_time = None;
-        
+
         if (collect_dynamic == True):
-            dyn_state = [];
-            dyn_time = [];
-            
-            dyn_state.append(self._states);
-            dyn_time.append(0);
-        
-        step = time / steps;
-        int_step = step / 10.0;
-        
-        for t in numpy.arange(step, time + step, step):
-            # update states of oscillators
-            self._states = self._calculate_states(solution, t, step, int_step);
-            
+            # the whole dynamic is preallocated and filled row by row - rows are copies of states,
+            # thus the dynamic never aliases the state vector that is advanced by the solver.
+            dyn_state = numpy.empty((len(t_points) + 1, self._num_osc), dtype = self._dtype);
+            dyn_time = numpy.empty(len(t_points) + 1);
+
+            dyn_state[0] = self._states;
+            dyn_time[0] = 0.0;
+
+        for index_step in range(len(t_points)):
             # update states of oscillators
+            self._states = self._calculate_states(solution, t_sub);
+
             if (collect_dynamic is True):
-                dyn_state.append(self._states);
-                dyn_time.append(t);
-        
+                dyn_state[index_step + 1] = self._states;
+                dyn_time[index_step + 1] = t_points[index_step];
+
         if (collect_dynamic is False):
-            dyn_state.append(self._states);
-            dyn_time.append(time);
-        
+            dyn_state = [ self._states.copy() ];
+            dyn_time = [ time ];
+
         return hysteresis_dynamic(dyn_state, dyn_time);
 
 
-    def _calculate_states(self, solution, t, step, int_step):
+    def _simulate_static_ccore(self, steps, time, collect_dynamic):
+        """!
+        @brief Performs static simulation of the network by the CCORE library.
+        @details The whole RK4 time-stepping with hysteresis thresholding is performed by native
+                  code - the python side only passes the effective weight matrix with states of
+                  neurons to the library and repackages the output dynamic.
+
+        @param[in] steps (uint): Number steps of simulations during simulation.
+        @param[in] time (double): Time of simulation.
+        @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
+
+        @return (hysteresis_dynamic) Dynamic of oscillatory network.
+
+        """
+
+        network_pointer = wrapper.hysteresis_create(self._num_osc, numpy.asarray(self._W, dtype = numpy.float64).ravel().tolist());
+
+        try:
+            wrapper.hysteresis_set_states(network_pointer, numpy.asarray(self._states, dtype = numpy.float64).tolist());
+            wrapper.hysteresis_set_outputs(network_pointer, numpy.asarray(self._outputs, dtype = numpy.float64).tolist());
+
+            dynamic_pointer = wrapper.hysteresis_simulate_static(network_pointer, steps, time, collect_dynamic);
+
+            try:
+                dyn_state = wrapper.hysteresis_dynamic_get_output(dynamic_pointer);
+                dyn_time = wrapper.hysteresis_dynamic_get_time(dynamic_pointer);
+            finally:
+                wrapper.hysteresis_dynamic_destroy(dynamic_pointer);
+        finally:
+            wrapper.hysteresis_destroy(network_pointer);
+
+        self._states = numpy.asarray(dyn_state[-1], dtype = self._dtype);
+
+        return hysteresis_dynamic(dyn_state, dyn_time);
+
+
+    def _calculate_states(self, solution, t_grid):
         """!
         @brief Calculates new states for neurons using differential calculus. Returns new states for neurons.
-        
+
         @param[in] solution (solve_type): Type solver of the differential equation.
-        @param[in] t (double): Current time of simulation.
-        @param[in] step (double): Step of solution at the end of which states of oscillators should be calculated.
-        @param[in] int_step (double): Step differentiation that is used for solving differential equation.
-        
-        @return (list) New states for neurons.
-        
+        @param[in] t_grid (numpy.ndarray): Integration grid of one step of simulation - the right hand
+                    side is time-invariant, thus the grid is relative and reused for every step.
+
+        @return (numpy.ndarray) New states for neurons.
+
         """
-        
-        next_states = [0] * self._num_osc;
-        
-        for index in range (0, self._num_osc, 1):            
-            result = odeint(self._neuron_states, self._states[index], numpy.arange(t - step, t, int_step), (index , ));
-            next_states[index] = result[len(result) - 1][0];
-        
-        self._outputs = [val for val in self._outputs_buffer];
-        return next_states;
\ No newline at end of file
+
+        # outputs of neurons are fixed during the step, thus the whole coupled system is advanced
+        # by one solver call instead of one call per neuron; the analytical Jacobian spares the
+        # solver from numerical Jacobian approximation.
+        ivp_solution = solve_ivp(self._rhs_compiled, (t_grid[0], t_grid[-1]), self._states, method = 'LSODA',
+                                 jac = self._jac, t_eval = t_grid, rtol = 1e-5, atol = 1e-8);
+
+        result = ivp_solution.y.T;
+
+        # hysteresis thresholding is applied to the trajectory substep by substep.
+        for states in result[1 : ]:
+            self._outputs_buffer = numpy.where(states > 1.0, 1.0, numpy.where(states < -1.0, -1.0, self._outputs_buffer));
+
+        numpy.copyto(self._outputs, self._outputs_buffer);
+        return result[-1];
\ No newline at end of file
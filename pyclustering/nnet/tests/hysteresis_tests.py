@@ -25,46 +25,65 @@
 
 import unittest;
 
+from concurrent.futures import ProcessPoolExecutor;
+
 from pyclustering.nnet.hysteresis import hysteresis_network;
 from pyclustering.nnet import *;
 
 from pyclustering.utils import extract_number_oscillations;
 
+
+def _run_oscillation_simulation(num_osc, own_weight, neigh_weight, steps, time, initial_states, initial_outputs, conn_repr):
+    """!
+    @brief Simulates hysteresis oscillatory network with specified parameters and returns number of
+            oscillations of each oscillator. Module level function, thus simulations of independent
+            scenarios can be scattered to pool of processes.
+
+    """
+    network = hysteresis_network(num_osc, own_weight, neigh_weight, type_conn_represent = conn_repr);
+
+    if (initial_states is not None):
+        network.states = initial_states;
+
+    if (initial_outputs is not None):
+        network.outputs = initial_outputs;
+
+    output_dynamic = network.simulate(steps, time);
+
+    return [ extract_number_oscillations(output_dynamic.output, index, 0.9) for index in range(num_osc) ];
+
+
 class Test(unittest.TestCase):
-    def templateOscillationExistance(self, num_osc, own_weight, neigh_weight, steps, time, initial_states = None, initial_outputs = None, conn_repr = conn_represent.MATRIX):
-        network = hysteresis_network(num_osc, own_weight, neigh_weight, type_conn_represent = conn_repr);
-        
-        if (initial_states is not None):
-            network.states = initial_states;
-            
-        if (initial_outputs is not None):
-            network.outputs = initial_outputs;
-        
-        output_dynamic = network.simulate(steps, time);
-        
-        oscillations = [];
-        for index in range(num_osc):
-            number_oscillations = extract_number_oscillations(output_dynamic.output, index, 0.9);
-            oscillations.append(number_oscillations)
-            
-            assert number_oscillations > 1;
+    def templateOscillationExistance(self, scenarios):
+        # each scenario is an independent simulation - the whole battery is executed in parallel.
+        with ProcessPoolExecutor() as executor:
+            futures = [ executor.submit(_run_oscillation_simulation, *scenario) for scenario in scenarios ];
+            results = [ future.result() for future in futures ];
+
+        for oscillations in results:
+            for number_oscillations in oscillations:
+                assert number_oscillations > 1;
 
 
     def testOscillationsOneOscillator(self):
-        self.templateOscillationExistance(1, -2, -1, 1000, 10);
-        self.templateOscillationExistance(1, -4, -1, 1000, 10);
-        
+        self.templateOscillationExistance([
+            (1, -2, -1, 1000, 10, None, None, conn_represent.MATRIX),
+            (1, -4, -1, 1000, 10, None, None, conn_represent.MATRIX) ]);
+
     def testOscillationsTwoOscillators(self):
-        self.templateOscillationExistance(2, -4, 1, 1000, 10, [1, 0], [1, 1]);
-        self.templateOscillationExistance(2, -4, -1, 1000, 10, [1, 0], [1, 1]);
-        
+        self.templateOscillationExistance([
+            (2, -4, 1, 1000, 10, [1, 0], [1, 1], conn_represent.MATRIX),
+            (2, -4, -1, 1000, 10, [1, 0], [1, 1], conn_represent.MATRIX) ]);
+
     def testOscillationsFiveOscillators(self):
-        self.templateOscillationExistance(5, -4, -1, 1000, 10, [1, 0.5, 0, -0.5, -1], [1, 1, 1, 1, 1]);
-        
+        self.templateOscillationExistance([
+            (5, -4, -1, 1000, 10, [1, 0.5, 0, -0.5, -1], [1, 1, 1, 1, 1], conn_represent.MATRIX) ]);
+
     def testListConnectionRepresentation(self):
-        self.templateOscillationExistance(1, -2, -1, 1000, 10, conn_repr = conn_represent.LIST);
-        self.templateOscillationExistance(2, -4, -1, 1000, 10, [1, 0], [1, 1], conn_repr = conn_represent.LIST);
-        self.templateOscillationExistance(5, -4, -1, 1000, 10, [1, 0.5, 0, -0.5, -1], [1, 1, 1, 1, 1], conn_repr = conn_represent.LIST);
+        self.templateOscillationExistance([
+            (1, -2, -1, 1000, 10, None, None, conn_represent.LIST),
+            (2, -4, -1, 1000, 10, [1, 0], [1, 1], conn_represent.LIST),
+            (5, -4, -1, 1000, 10, [1, 0.5, 0, -0.5, -1], [1, 1, 1, 1, 1], conn_represent.LIST) ]);
     
     
     def templateSynchronousEnsemblesAllocation(self, num_osc, own_weight, neigh_weight, steps, time, initial_states, initial_outputs, sync_ensembles_sizes):